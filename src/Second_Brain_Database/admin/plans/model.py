@@ -1,4 +1,3 @@
-from pymongo import MongoClient
 from Second_Brain_Database.database import db
 
 # Initialize the plans collection
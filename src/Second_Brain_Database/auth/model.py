@@ -1,4 +1,3 @@
-from pymongo import MongoClient
 from passlib.hash import bcrypt
 from bson.objectid import ObjectId
 from Second_Brain_Database.database import db
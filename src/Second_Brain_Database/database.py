@@ -1,5 +1,18 @@
-from Second_Brain_Database.config import MONGO_DB_NAME, MONGO_URL
+from Second_Brain_Database.config import (
+    MONGO_DB_NAME,
+    MONGO_URL,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_MAX_IDLE_TIME_MS,
+)
 from pymongo import MongoClient
 
-client = MongoClient(MONGO_URL)   
-db = client[str(MONGO_DB_NAME)]   
\ No newline at end of file
+# Single shared client; keep a warm pool so concurrent requests don't block on connection setup
+client = MongoClient(
+    MONGO_URL,
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    minPoolSize=MONGO_MIN_POOL_SIZE,
+    maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+    retryWrites=True,
+)
+db = client[str(MONGO_DB_NAME)]